@@ -0,0 +1,61 @@
+"""add analytics materialized views
+
+Revision ID: b8e4d1f6a230
+Revises: c2455710c8b1
+Create Date: 2026-08-30 10:12:45.101833
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e4d1f6a230'
+down_revision: Union[str, None] = 'c2455710c8b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_avg_duration AS
+        SELECT 1 AS id,
+               AVG(planned_date_end - planned_date_begin) AS average_duration
+        FROM work_orders
+        WHERE status = 'done'
+        """
+    )
+    op.execute("CREATE UNIQUE INDEX ux_mv_avg_duration ON mv_avg_duration (id)")
+
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_order_frequency AS
+        SELECT customer_id, COUNT(*) AS order_count
+        FROM work_orders
+        GROUP BY customer_id
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ux_mv_order_frequency ON mv_order_frequency (customer_id)"
+    )
+
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_monthly_activity AS
+        SELECT date_trunc('month', created_at) AS ym, COUNT(*) AS total_orders
+        FROM work_orders
+        GROUP BY 1
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ux_mv_monthly_activity ON mv_monthly_activity (ym)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_monthly_activity")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_order_frequency")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_avg_duration")
@@ -0,0 +1,120 @@
+"""incremental analytics aggregates
+
+Revision ID: d94f7c3a58e1
+Revises: b8e4d1f6a230
+Create Date: 2026-08-30 11:03:21.448276
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd94f7c3a58e1'
+down_revision: Union[str, None] = 'b8e4d1f6a230'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Replace the refresh-based views with summary tables maintained in
+    # O(1) per write by a trigger; the delta per commit is a single row.
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_order_frequency")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_monthly_activity")
+
+    op.execute(
+        """
+        CREATE TABLE agg_customer_orders (
+            customer_id UUID PRIMARY KEY,
+            cnt BIGINT NOT NULL DEFAULT 0
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE agg_monthly_orders (
+            ym TIMESTAMP PRIMARY KEY,
+            cnt BIGINT NOT NULL DEFAULT 0
+        )
+        """
+    )
+
+    op.execute(
+        """
+        INSERT INTO agg_customer_orders (customer_id, cnt)
+        SELECT customer_id, COUNT(*) FROM work_orders GROUP BY customer_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO agg_monthly_orders (ym, cnt)
+        SELECT date_trunc('month', created_at), COUNT(*)
+        FROM work_orders GROUP BY 1
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION work_orders_maintain_aggregates()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                UPDATE agg_customer_orders SET cnt = cnt - 1
+                WHERE customer_id = OLD.customer_id;
+                UPDATE agg_monthly_orders SET cnt = cnt - 1
+                WHERE ym = date_trunc('month', OLD.created_at);
+            END IF;
+            IF TG_OP <> 'DELETE' THEN
+                INSERT INTO agg_customer_orders (customer_id, cnt)
+                VALUES (NEW.customer_id, 1)
+                ON CONFLICT (customer_id)
+                DO UPDATE SET cnt = agg_customer_orders.cnt + 1;
+                INSERT INTO agg_monthly_orders (ym, cnt)
+                VALUES (date_trunc('month', NEW.created_at), 1)
+                ON CONFLICT (ym)
+                DO UPDATE SET cnt = agg_monthly_orders.cnt + 1;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_work_orders_aggregates
+        AFTER INSERT OR UPDATE OR DELETE ON work_orders
+        FOR EACH ROW EXECUTE FUNCTION work_orders_maintain_aggregates()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_work_orders_aggregates ON work_orders")
+    op.execute("DROP FUNCTION IF EXISTS work_orders_maintain_aggregates()")
+    op.execute("DROP TABLE IF EXISTS agg_monthly_orders")
+    op.execute("DROP TABLE IF EXISTS agg_customer_orders")
+
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_order_frequency AS
+        SELECT customer_id, COUNT(*) AS order_count
+        FROM work_orders
+        GROUP BY customer_id
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ux_mv_order_frequency ON mv_order_frequency (customer_id)"
+    )
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_monthly_activity AS
+        SELECT date_trunc('month', created_at) AS ym, COUNT(*) AS total_orders
+        FROM work_orders
+        GROUP BY 1
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ux_mv_monthly_activity ON mv_monthly_activity (ym)"
+    )
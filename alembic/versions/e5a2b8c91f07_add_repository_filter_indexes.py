@@ -0,0 +1,44 @@
+"""add repository filter indexes
+
+Revision ID: e5a2b8c91f07
+Revises: d94f7c3a58e1
+Create Date: 2026-08-30 11:41:09.772514
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a2b8c91f07'
+down_revision: Union[str, None] = 'd94f7c3a58e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Partial index: count_active_customers only ever touches active rows.
+    op.execute(
+        """
+        CREATE INDEX ix_customers_active_start
+        ON customers (is_active, start_date) WHERE is_active
+        """
+    )
+    op.create_index("ix_work_orders_created_at", "work_orders", ["created_at"])
+    op.create_index("ix_work_orders_status", "work_orders", ["status"])
+    op.create_index(
+        "ix_work_orders_customer_status", "work_orders", ["customer_id", "status"]
+    )
+    # Matches the index=True on the model's FK column for databases managed
+    # through migrations rather than create_all.
+    op.create_index("ix_work_orders_customer_id", "work_orders", ["customer_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_work_orders_customer_id", table_name="work_orders")
+    op.drop_index("ix_work_orders_customer_status", table_name="work_orders")
+    op.drop_index("ix_work_orders_status", table_name="work_orders")
+    op.drop_index("ix_work_orders_created_at", table_name="work_orders")
+    op.execute("DROP INDEX IF EXISTS ix_customers_active_start")
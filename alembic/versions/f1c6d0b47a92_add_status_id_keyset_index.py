@@ -0,0 +1,27 @@
+"""add status id keyset index
+
+Revision ID: f1c6d0b47a92
+Revises: e5a2b8c91f07
+Create Date: 2026-08-30 13:27:50.330118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c6d0b47a92'
+down_revision: Union[str, None] = 'e5a2b8c91f07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covers WHERE status = :s AND id > :after ORDER BY id LIMIT :n.
+    op.create_index("ix_work_orders_status_id", "work_orders", ["status", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_work_orders_status_id", table_name="work_orders")
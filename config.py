@@ -1,10 +1,95 @@
 import os
+from dataclasses import dataclass
 from dotenv import load_dotenv
 
-load_dotenv()
+_REQUIRED = ("DATABASE_URL", "REDIS_HOST", "REDIS_PORT")
 
+# Allow-lists live at module scope as frozensets: built once, O(1)
+# membership, and no per-check list construction.
+_ALLOWED_ENVS = frozenset({"development", "staging", "production", "test"})
+_ALLOWED_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
 
+
+def _validated(name, value, allowed):
+    if value not in allowed:
+        raise ValueError(f"{name} must be one of {sorted(allowed)}, got {value!r}")
+    return value
+
+# Parsing .env costs a file read on every process start. Skip it when the
+# orchestrator already exported everything we need, and always in production
+# where configuration must come from the real environment.
+if os.getenv("ENVIRONMENT") != "production" and not all(
+    key in os.environ for key in _REQUIRED
+):
+    load_dotenv()
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    POSTGRES_CONFIG = os.getenv("DATABASE_URL")
-    REDIS_HOST = os.getenv("REDIS_HOST")
-    REDIS_PORT = os.getenv("REDIS_PORT")
+    """Application configuration resolved once at import time.
+
+    Values are read from the environment a single time when the module is
+    imported, so downstream modules pay a plain attribute load instead of
+    an ``os.environ`` lookup on every access.
+    """
+
+    ENVIRONMENT: str
+    LOG_LEVEL: str
+    ALLOWED_ORIGINS: frozenset[str]
+    POSTGRES_CONFIG: str | None
+    REDIS_HOST: str | None
+    REDIS_PORT: str | None
+    REDIS_URL: str | None
+    DB_POOL_SIZE: int
+    DB_MAX_OVERFLOW: int
+    DB_POOL_TIMEOUT: int
+    DB_POOL_RECYCLE: int
+    DB_MAX_RETRIES: int
+    EVENT_QUEUE_MAX: int
+    INIT_DB: bool
+    DB_RAISELOAD: bool
+
+
+CONFIG = Config(
+    ENVIRONMENT=_validated(
+        "ENVIRONMENT",
+        os.environ.get("ENVIRONMENT", "development"),
+        _ALLOWED_ENVS,
+    ),
+    LOG_LEVEL=_validated(
+        "LOG_LEVEL",
+        os.environ.get("LOG_LEVEL", "INFO").upper(),
+        _ALLOWED_LOG_LEVELS,
+    ),
+    # Normalized to a frozenset once here, so later membership checks are
+    # O(1) and the wildcard test happens a single time at startup.
+    ALLOWED_ORIGINS=frozenset(
+        origin.strip()
+        for origin in os.environ.get("ALLOWED_ORIGINS", "*").split(",")
+        if origin.strip()
+    ),
+    POSTGRES_CONFIG=os.environ.get("DATABASE_URL"),
+    REDIS_HOST=os.environ.get("REDIS_HOST"),
+    REDIS_PORT=os.environ.get("REDIS_PORT"),
+    # Built once here; callers needing a URL-style address (cache backends,
+    # tooling) read a constant instead of re-formatting it per call.
+    REDIS_URL=(
+        f"redis://{os.environ['REDIS_HOST']}:{os.environ.get('REDIS_PORT', '6379')}/0"
+        if os.environ.get("REDIS_HOST")
+        else None
+    ),
+    DB_POOL_SIZE=int(os.environ.get("DB_POOL_SIZE", "20")),
+    DB_MAX_OVERFLOW=int(os.environ.get("DB_MAX_OVERFLOW", "30")),
+    DB_POOL_TIMEOUT=int(os.environ.get("DB_POOL_TIMEOUT", "10")),
+    DB_POOL_RECYCLE=int(os.environ.get("DB_POOL_RECYCLE", "1800")),
+    DB_MAX_RETRIES=int(os.environ.get("DB_MAX_RETRIES", "3")),
+    EVENT_QUEUE_MAX=int(os.environ.get("EVENT_QUEUE_MAX", "10000")),
+    # Schema creation belongs to a one-shot migration job in production;
+    # workers should not all race create_all against Postgres on boot.
+    INIT_DB=os.environ.get(
+        "INIT_DB", "0" if os.environ.get("ENVIRONMENT") == "production" else "1"
+    )
+    in ("1", "true", "True"),
+    # Dev/CI only: turn unplanned lazy loads into loud errors.
+    DB_RAISELOAD=os.environ.get("DB_RAISELOAD", "0") in ("1", "true", "True"),
+)
@@ -1,17 +1,108 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm.session import sessionmaker
+from typing import AsyncGenerator
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.declarative import declarative_base
 
-from config import Config
+from config import CONFIG
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+_POOL_OPTIONS = dict(
+    pool_size=CONFIG.DB_POOL_SIZE,
+    max_overflow=CONFIG.DB_MAX_OVERFLOW,
+    pool_timeout=CONFIG.DB_POOL_TIMEOUT,
+    pool_recycle=CONFIG.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    pool_use_lifo=True,
+)
+
+# Sync engine, kept only for startup table creation (INIT_DB).
+engine = create_engine(CONFIG.POSTGRES_CONFIG, **_POOL_OPTIONS)
+
+# AsyncAdaptedQueuePool is the pool the async engine must use; naming it
+# explicitly guards against someone passing a sync QueuePool through the
+# shared options.
+async_engine = create_async_engine(
+    CONFIG.POSTGRES_CONFIG.replace("postgresql://", "postgresql+asyncpg://"),
+    poolclass=AsyncAdaptedQueuePool,
+    **_POOL_OPTIONS,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 
-engine = create_engine(Config.POSTGRES_CONFIG)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+if CONFIG.DB_RAISELOAD:
+    # Dev/CI guard: any relationship that was not loaded explicitly raises
+    # instead of silently issuing a lazy SELECT, so N+1 regressions fail
+    # the test run rather than shipping.
+    @event.listens_for(Session, "do_orm_execute")
+    def _raise_on_unplanned_lazy_load(execute_state):
+        # Exempt column (deferred/refresh) and relationship loads: those
+        # are the ORM's own follow-up queries, and tagging them would also
+        # override planned eager loads like lazy="selectin".
+        if (
+            execute_state.is_select
+            and not execute_state.is_column_load
+            and not execute_state.is_relationship_load
+        ):
+            execute_state.statement = execute_state.statement.options(raiseload("*"))
+
+
+@retry(
+    stop=stop_after_attempt(CONFIG.DB_MAX_RETRIES),
+    wait=wait_exponential_jitter(initial=0.05, max=0.4),
+    # asyncpg surfaces an unreachable server as a bare OSError
+    # (ConnectionRefusedError) rather than a wrapped OperationalError, so
+    # the retry must cover both families.
+    retry=retry_if_exception_type((DBAPIError, OSError)),
+    reraise=True,
+)
+async def _acquire_session() -> AsyncSession:
+    """Open a session and check out its connection, retrying transient
+    connection failures with backoff."""
+    db = AsyncSessionLocal()
+    try:
+        await db.connection()
+    except BaseException:
+        await db.close()
+        raise
+    return db
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    try:
+        db = await _acquire_session()
+    except OSError as exc:
+        # Translate raw socket failures into the SQLAlchemy error the
+        # 503 + Retry-After handler in main.py is registered for.
+        raise OperationalError("database connection failed", None, exc) from exc
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+async def get_db_lazy() -> AsyncGenerator[AsyncSession, None]:
+    """Session that defers connection checkout to its first statement.
 
-def get_db():
-    db = SessionLocal()
+    For endpoints fronted by the response cache: a hit must answer
+    without touching the pool, which get_db's eager checkout would
+    defeat. Connect failures surface on first use instead of here.
+    """
+    db = AsyncSessionLocal()
     try:
         yield db
     finally:
-        db.close()
+        await db.close()
@@ -0,0 +1,276 @@
+import asyncio
+import collections
+import logging
+import threading
+import time
+
+import orjson
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy.exc import DBAPIError, OperationalError
+
+from config import CONFIG
+
+_log = logging.getLogger(__name__)
+
+# One shared body and builder for every database-unavailable response;
+# building three near-identical handlers allocated the same dict per call.
+_DB_UNAVAILABLE = {"detail": "Database service temporarily unavailable"}
+
+_RETRY_AFTER = {
+    OperationalError: "30",
+    DBAPIError: "60",
+}
+
+
+def _503(retry_after="60"):
+    return ORJSONResponse(
+        status_code=503, content=_DB_UNAVAILABLE, headers={"Retry-After": retry_after}
+    )
+
+
+async def database_error_handler(request, exc):
+    _log.error("Database error on %s %s: %s", request.method, request.url.path, exc)
+    return _503(_RETRY_AFTER.get(type(exc), "60"))
+
+
+# The 500 body is constant; serialize it once instead of on every unhandled
+# exception, which may fire thousands of times per second during an outage.
+_500_BODY = orjson.dumps(
+    {
+        "detail": "Internal server error",
+        "message": "An unexpected error occurred. Please try again later.",
+    }
+)
+
+
+async def generic_exception_handler(request, exc):
+    # exc_info=True lets the logging formatter build the traceback lazily,
+    # and skip it entirely when the record is filtered out.
+    _log.error(
+        "Unhandled exception on %s %s: %s",
+        request.method,
+        request.url.path,
+        exc,
+        exc_info=True,
+    )
+    return Response(content=_500_BODY, media_type="application/json", status_code=500)
+
+
+async def validation_error_handler(request, exc):
+    # Keep loc as a list of strings: clients get structure instead of a
+    # dotted path and we skip a join per error.
+    errors = [
+        {"loc": list(map(str, error["loc"])), "message": error["msg"], "type": error["type"]}
+        for error in exc.errors()
+    ]
+    return ORJSONResponse(status_code=422, content={"detail": errors})
+
+
+class EventQueue:
+    """Bounded in-memory buffer for events that could not reach Redis.
+
+    The deque holds at most ``maxlen`` entries; when full, the oldest
+    event is discarded and ``dropped`` incremented so a long outage
+    cannot grow the process heap without bound. Access is serialized
+    with a lock since producers and the flusher run on different
+    threads.
+    """
+
+    def __init__(self, maxlen=None):
+        self.queue = collections.deque(maxlen=maxlen or CONFIG.EVENT_QUEUE_MAX)
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def add_event(self, event):
+        with self._lock:
+            if len(self.queue) == self.queue.maxlen:
+                self.dropped += 1
+            self.queue.append((time.monotonic(), event))
+
+    def drain(self, batch_size):
+        """Pop up to ``batch_size`` queued events, oldest first."""
+        batch = []
+        with self._lock:
+            while self.queue and len(batch) < batch_size:
+                batch.append(self.queue.popleft()[1])
+        return batch
+
+    def oldest_age(self):
+        """Age in seconds of the oldest queued event, or 0.0 when empty."""
+        with self._lock:
+            if not self.queue:
+                return 0.0
+            return time.monotonic() - self.queue[0][0]
+
+    def __len__(self):
+        with self._lock:
+            return len(self.queue)
+
+
+event_queue = EventQueue()
+
+FLUSH_INTERVAL = 5.0
+FLUSH_BATCH_SIZE = 100
+
+_flusher_stop = threading.Event()
+
+
+def _flush_batch():
+    """Re-emit one batch of queued events through a single Redis pipeline.
+
+    Returns True when a full batch was flushed and more events may be
+    waiting. On failure the batch is put back on the queue before the
+    exception propagates to the circuit breaker.
+    """
+    from tasks import xadd_many
+
+    batch = event_queue.drain(FLUSH_BATCH_SIZE)
+    if not batch:
+        return False
+    try:
+        xadd_many(batch)
+    except Exception:
+        for event in batch:
+            event_queue.add_event(event)
+        raise
+    return len(batch) == FLUSH_BATCH_SIZE
+
+
+def _flusher():
+    while not _flusher_stop.wait(FLUSH_INTERVAL):
+        try:
+            while redis_circuit_breaker.call(_flush_batch):
+                pass
+        except Exception:
+            # Sustained Redis failure trips the breaker; events stay queued
+            # until the next interval.
+            pass
+
+
+def close():
+    """Stop the flusher thread and attempt a final drain on shutdown."""
+    _flusher_stop.set()
+    _flusher_thread.join(timeout=FLUSH_INTERVAL)
+    try:
+        while _flush_batch():
+            pass
+    except Exception:
+        pass
+
+
+class CircuitBreaker:
+    """Circuit breaker guarding calls to an unreliable dependency.
+
+    Outcomes are recorded in a sliding window of ``metrics_window``
+    seconds; the breaker opens when the window holds at least
+    ``minimum_requests`` calls and the failure rate reaches
+    ``failure_rate_threshold``. Passing ``failure_rate_threshold=None``
+    restores absolute-count semantics: open after ``failure_threshold``
+    consecutive failures. After ``recovery_timeout`` seconds the breaker
+    goes half-open and lets calls through, closing again only after
+    ``success_threshold`` consecutive successes. State transitions are
+    protected by a lock and timed with the monotonic clock so NTP jumps
+    cannot reopen or close the breaker spuriously.
+    """
+
+    def __init__(
+        self,
+        failure_threshold=5,
+        recovery_timeout=30.0,
+        success_threshold=2,
+        failure_rate_threshold=0.5,
+        minimum_requests=20,
+        metrics_window=60.0,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.success_threshold = success_threshold
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_requests = minimum_requests
+        self.metrics_window = metrics_window
+        self.state = "closed"
+        self.failure_count = 0
+        self.success_count = 0
+        self.opened_at = 0.0
+        self._outcomes = collections.deque()
+        self._lock = threading.Lock()
+        self._async_lock = asyncio.Lock()
+
+    def _before_call(self):
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                raise CircuitBreakerOpenError("circuit breaker is open")
+            self.state = "half_open"
+            self.success_count = 0
+
+    def _record(self, is_failure):
+        now = time.monotonic()
+        self._outcomes.append((now, is_failure))
+        cutoff = now - self.metrics_window
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+
+    def _should_trip(self):
+        if self.failure_rate_threshold is None:
+            return self.failure_count >= self.failure_threshold
+        total = len(self._outcomes)
+        if total < self.minimum_requests:
+            return False
+        failures = sum(1 for _, is_failure in self._outcomes if is_failure)
+        return failures / total >= self.failure_rate_threshold
+
+    def _on_success(self):
+        self._record(False)
+        if self.state == "half_open":
+            self.success_count += 1
+            if self.success_count >= self.success_threshold:
+                self.state = "closed"
+                self.failure_count = 0
+                self._outcomes.clear()
+        else:
+            self.failure_count = 0
+
+    def _on_failure(self):
+        self._record(True)
+        self.failure_count += 1
+        if self.state == "half_open" or self._should_trip():
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def call(self, func, *args, **kwargs):
+        with self._lock:
+            self._before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            with self._lock:
+                self._on_failure()
+            raise
+        with self._lock:
+            self._on_success()
+        return result
+
+    async def acall(self, func, *args, **kwargs):
+        async with self._async_lock:
+            self._before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            async with self._async_lock:
+                self._on_failure()
+            raise
+        async with self._async_lock:
+            self._on_success()
+        return result
+
+
+class CircuitBreakerOpenError(Exception):
+    """Raised when a call is rejected because the breaker is open."""
+
+
+redis_circuit_breaker = CircuitBreaker()
+
+_flusher_thread = threading.Thread(
+    target=_flusher, name="event-queue-flusher", daemon=True
+)
+_flusher_thread.start()
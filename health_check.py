@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
+
+from database import AsyncSessionLocal
+from tasks import redis_async_client
+
+router = APIRouter(tags=["Health"])
+
+# Probe storms (multiple replicas x kubelet + load balancer) would otherwise
+# translate into hundreds of SELECT 1/PING round-trips per second. The last
+# readiness verdict is reused for a short window instead.
+_CACHE_TTL = 2.0
+_cache: tuple[float, int, dict] | None = None
+_cache_lock = asyncio.Lock()
+
+
+@router.get("/health")
+def health_check():
+    return {"status": "alive"}
+
+
+async def _probe_database():
+    # Session acquisition is part of what this probe verifies, so it
+    # happens here rather than in Depends(get_db): a down database
+    # becomes a "database": "error" verdict instead of an exception
+    # raised before the handler runs — and a cache hit never touches
+    # the pool at all.
+    db = AsyncSessionLocal()
+    try:
+        await db.execute(text("SELECT 1"))
+    finally:
+        await db.close()
+
+
+@router.get("/ready")
+async def readiness_check():
+    global _cache
+
+    async with _cache_lock:
+        if _cache is not None and time.monotonic() - _cache[0] < _CACHE_TTL:
+            _, status_code, content = _cache
+            return ORJSONResponse(status_code=status_code, content=content)
+
+        # Run both dependency probes concurrently so the probe costs
+        # max(t_db, t_redis) instead of their sum.
+        db_result, redis_result = await asyncio.gather(
+            _probe_database(),
+            asyncio.wait_for(redis_async_client.ping(), timeout=0.5),
+            return_exceptions=True,
+        )
+
+        dependencies_status = {
+            "database": "error" if isinstance(db_result, Exception) else "ok",
+            "redis": "error" if isinstance(redis_result, Exception) else "ok",
+        }
+        ready = all(state == "ok" for state in dependencies_status.values())
+
+        status_code = 200 if ready else 503
+        content = {
+            "status": "ready" if ready else "unavailable",
+            "dependencies": dependencies_status,
+        }
+        _cache = (time.monotonic(), status_code, content)
+
+    return ORJSONResponse(status_code=status_code, content=content)
@@ -0,0 +1,97 @@
+import logging
+import re
+import uuid
+from contextvars import ContextVar
+
+# Redaction patterns are compiled once at import; _redact_sensitive_data runs
+# on every logged query so rebuilding them per call would dominate its cost.
+_REDACTIONS = [
+    (
+        re.compile(r"password['\"]?\s*[:=]\s*['\"]?[^'\",\s]+['\"]?", re.IGNORECASE),
+        "password=***",
+    ),
+    (
+        re.compile(r"token['\"]?\s*[:=]\s*['\"]?[^'\",\s]+['\"]?", re.IGNORECASE),
+        "token=***",
+    ),
+    (
+        re.compile(r"api_?key['\"]?\s*[:=]\s*['\"]?[^'\",\s]+['\"]?", re.IGNORECASE),
+        "api_key=***",
+    ),
+    (
+        re.compile(r"secret['\"]?\s*[:=]\s*['\"]?[^'\",\s]+['\"]?", re.IGNORECASE),
+        "secret=***",
+    ),
+]
+
+
+# Per-task (and per-thread) correlation id; a plain attribute would be shared
+# across concurrent requests and log the wrong id for in-flight ones.
+_correlation_id: ContextVar[str] = ContextVar(
+    "correlation_id", default="no-correlation-id"
+)
+
+
+class CorrelationIdFilter(logging.Filter):
+    """Attach the current correlation id to every log record."""
+
+    def filter(self, record):
+        record.correlation_id = _correlation_id.get()
+        return True
+
+
+_correlation_filter = CorrelationIdFilter()
+
+
+def set_correlation_id(correlation_id=None):
+    # .hex skips the hyphenated __str__ formatting and is ~2x faster.
+    correlation_id = correlation_id or uuid.uuid4().hex
+    _correlation_id.set(correlation_id)
+    return correlation_id
+
+
+def clear_correlation_id():
+    _correlation_id.set("no-correlation-id")
+
+
+def setup_logging(level=logging.INFO):
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter(
+            "%(asctime)s %(levelname)s %(name)s [%(correlation_id)s] %(message)s"
+        )
+    )
+    handler.addFilter(_correlation_filter)
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(handler)
+
+
+class StructuredLogger:
+    """Logger wrapper emitting request/query records with redacted payloads."""
+
+    def __init__(self, name):
+        self.logger = logging.getLogger(name)
+
+    def _redact_sensitive_data(self, text: str) -> str:
+        for pattern, replacement in _REDACTIONS:
+            text = pattern.sub(replacement, text)
+        return text
+
+    def log_request(self, method, path, status_code, duration):
+        # The fields go through the message, not extra=: the line format
+        # never renders custom extra fields, and %-args are only
+        # interpolated when a handler accepts the record.
+        self.logger.info(
+            "%s %s -> %s in %.1fms", method, path, status_code, duration * 1000
+        )
+
+    def log_query(self, query, duration, correlation_id):
+        # Redaction is regex work; skip it entirely when DEBUG records
+        # would be discarded anyway.
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        redacted = self._redact_sensitive_data(query)
+        self.logger.debug(
+            "Query [%s] took %.1fms: %s", correlation_id, duration * 1000, redacted
+        )
@@ -1,8 +1,28 @@
+import asyncio
+import logging
+
 from fastapi import FastAPI
-from database import Base, engine
+from fastapi.exceptions import RequestValidationError
+from database import Base, engine, async_engine
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import SQLAlchemyError
 
+import health_check
+from config import CONFIG
+from error_handlers import (
+    close as close_event_flusher,
+    database_error_handler,
+    generic_exception_handler,
+    validation_error_handler,
+)
+from logger import setup_logging
+from middleware import LoggingMiddleware, SecurityHeadersMiddleware
+from repositories import analytics_repository
 from routers import customer_router, work_order_router, analytics_router
+from tasks import redis_async_client, start_publisher, stop_publisher
+
+setup_logging(CONFIG.LOG_LEVEL)
 
 app = FastAPI(
     title="Service Order Management System",
@@ -10,20 +30,80 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
-origins = ["*"]
+app.add_exception_handler(SQLAlchemyError, database_error_handler)
+# Lazy sessions connect on first statement, where asyncpg surfaces an
+# unreachable server as a bare OSError; map it to the same 503.
+app.add_exception_handler(OSError, database_error_handler)
+app.add_exception_handler(Exception, generic_exception_handler)
+app.add_exception_handler(RequestValidationError, validation_error_handler)
+
+app.add_middleware(LoggingMiddleware)
+app.add_middleware(SecurityHeadersMiddleware)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins,
+    allow_origins=list(CONFIG.ALLOWED_ORIGINS),
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["*"],
 )
 
-Base.metadata.create_all(bind=engine)
+if CONFIG.INIT_DB:
+    Base.metadata.create_all(bind=engine)
+
+
+@app.on_event("startup")
+async def warm_up_db():
+    # Pay the TCP + auth cost of the first pooled connection at startup
+    # instead of on the first real request.
+    async with async_engine.connect():
+        pass
+
+
+@app.on_event("startup")
+async def ping_redis():
+    # Smoke-test Redis here rather than at import time, so module import
+    # stays free of network round-trips and a down Redis degrades the
+    # cache/event paths instead of preventing boot.
+    try:
+        await redis_async_client.ping()
+    except Exception as exc:
+        logging.getLogger(__name__).warning("Redis unavailable at startup: %s", exc)
+
+
+@app.on_event("startup")
+async def start_event_publisher():
+    await start_publisher()
+
+
+@app.on_event("startup")
+async def start_view_refresh():
+    # mv_avg_duration is refresh-based; without a periodic refresh it
+    # stays frozen at whatever the migration populated.
+    await analytics_repository.start_refresh_scheduler()
+
+
+@app.on_event("shutdown")
+async def stop_event_publisher():
+    await stop_publisher()
+
+
+@app.on_event("shutdown")
+async def stop_view_refresh():
+    await analytics_repository.stop_refresh_scheduler()
+
+
+@app.on_event("shutdown")
+async def stop_queue_flusher():
+    # After the publisher above: its shutdown drain may still push failed
+    # events onto the fallback queue. close() joins the flusher thread and
+    # does Redis I/O, so keep it off the event loop.
+    await asyncio.to_thread(close_event_flusher)
 
+app.include_router(health_check.router)
 app.include_router(customer_router.router)
 app.include_router(work_order_router.router)
 app.include_router(analytics_router.router)
@@ -0,0 +1,63 @@
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from logger import StructuredLogger, clear_correlation_id, set_correlation_id
+
+# Probe endpoints are hit every few seconds by the orchestrator; logging
+# them is pure noise and can exceed real traffic on quiet services.
+_SKIP = frozenset({"/health", "/ready"})
+
+# Constant header pairs, pre-encoded and pre-lowercased once at import.
+# Appending to raw_headers skips the MutableHeaders encode/lower work
+# that per-key assignment would repeat on every response.
+_SEC_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+    (b"cache-control", b"no-store"),
+)
+
+
+class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+    """Attach the standard security headers to every response."""
+
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        response.raw_headers.extend(_SEC_HEADERS)
+        return response
+
+
+class LoggingMiddleware(BaseHTTPMiddleware):
+    """Assign a correlation id per request and log method/path/duration."""
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.logger = StructuredLogger("request")
+
+    async def dispatch(self, request, call_next):
+        if request.url.path in _SKIP:
+            response = await call_next(request)
+            if response.status_code >= 500:
+                self.logger.logger.warning(
+                    "Probe %s failed with status %s",
+                    request.url.path,
+                    response.status_code,
+                )
+            return response
+
+        correlation_id = set_correlation_id(request.headers.get("X-Correlation-ID"))
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+            duration = time.perf_counter() - start
+            self.logger.log_request(
+                request.method, request.url.path, response.status_code, duration
+            )
+            response.headers["X-Correlation-ID"] = correlation_id
+            return response
+        finally:
+            clear_correlation_id()
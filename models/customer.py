@@ -20,7 +20,9 @@ class Customer(Base):
     is_active = Column(Boolean, nullable=False, default=False)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
-    work_orders = relationship("WorkOrder", back_populates="owner")
+    # selectin loads all children in one bounded IN-query per result set,
+    # instead of either per-row lazy SELECTs or a joined row explosion.
+    work_orders = relationship("WorkOrder", back_populates="owner", lazy="selectin")
 
     def __init__(
         self,
@@ -12,7 +12,9 @@ class WorkOrder(Base):
     __tablename__ = "work_orders"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    customer_id = Column(UUID(as_uuid=True), ForeignKey("customers.id"), nullable=False)
+    customer_id = Column(
+        UUID(as_uuid=True), ForeignKey("customers.id"), nullable=False, index=True
+    )
     title = Column(String, nullable=False)
     planned_date_begin = Column(DateTime, nullable=True)
     planned_date_end = Column(DateTime, nullable=True)
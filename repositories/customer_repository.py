@@ -1,11 +1,18 @@
+import logging
+
 from fastapi import HTTPException, status, Response
-from sqlalchemy.orm import Session
+from sqlalchemy import delete as sql_delete
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from models import Customer
 from schemas import schemas
 import uuid
 
+logger = logging.getLogger(__name__)
+
 
-def create_customer(request: schemas.Customer, db: Session):
+async def create_customer(request: schemas.Customer, db: AsyncSession):
     new_customer_id = str(uuid.uuid4())
 
     new_customer = Customer(
@@ -15,48 +22,60 @@ def create_customer(request: schemas.Customer, db: Session):
         address=request.address,
     )
     db.add(new_customer)
-    db.commit()
-    db.refresh(new_customer)
+    await db.commit()
+    await db.refresh(new_customer)
 
     return new_customer
 
 
-def get_all_customer(db: Session):
-    customers = db.query(Customer).all()
+async def get_all_customer(db: AsyncSession):
+    # The list response serializes each customer's work_orders; state the
+    # eager load here so the query is exactly two SELECTs (customers plus
+    # one IN-query for all their orders) regardless of result size.
+    customers = (
+        await db.scalars(
+            select(Customer).options(selectinload(Customer.work_orders))
+        )
+    ).all()
     return customers
 
 
-def get_active_customer(db: Session):
-    customers = db.query(Customer).filter(Customer.is_active == True).all()
+async def get_active_customer(db: AsyncSession):
+    # Stated eager load, same as get_all_customer: the response model
+    # walks work_orders, and under DB_RAISELOAD the query-level wildcard
+    # overrides the mapper-level lazy="selectin".
+    customers = (
+        await db.scalars(
+            select(Customer)
+            .where(Customer.is_active == True)
+            .options(selectinload(Customer.work_orders))
+        )
+    ).all()
     return customers
 
 
-def update_customer(id, request: schemas.Customer, db: Session):
-    customer = db.query(Customer).filter(Customer.id == id)
+async def update_customer(id, request: schemas.Customer, db: AsyncSession):
+    customer = await db.get(Customer, id)
 
-    if not customer.first():
+    if customer is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"The customer width id {id} not found",
         )
 
-    customer.update(
-        {
-            "first_name": request.first_name,
-            "last_name": request.last_name,
-            "address": request.address,
-        }
-    )
+    customer.first_name = request.first_name
+    customer.last_name = request.last_name
+    customer.address = request.address
 
-    db.commit()
+    await db.commit()
 
     return {"message": f"The customer was updated successfully"}
 
 
-def get_customer_by_id(id, db: Session):
-    customer = db.query(Customer).filter(Customer.id == id).first()
+async def get_customer_by_id(id, db: AsyncSession):
+    customer = await db.get(Customer, id)
 
-    if not customer:
+    if customer is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Customer with the id {id} is not available",
@@ -65,15 +84,20 @@ def get_customer_by_id(id, db: Session):
     return customer
 
 
-def delete_customer(id, db: Session):
-    customer = db.query(Customer).filter(Customer.id == id)
+async def delete_customer(id, db: AsyncSession):
+    # DELETE ... RETURNING both removes the row and reports whether it
+    # existed, replacing the SELECT + DELETE round-trip pair.
+    deleted_id = (
+        await db.execute(
+            sql_delete(Customer).where(Customer.id == id).returning(Customer.id)
+        )
+    ).scalar()
 
-    if not customer.first():
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"The customer width id {id} not found",
         )
 
-    customer.delete(synchronize_session=False)
-    db.commit()
-    return {"message": f"The customer {id} has been deleted sucessfully"}
+    await db.commit()
+    logger.info("Deleted customer %s", deleted_id)
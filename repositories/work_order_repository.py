@@ -1,23 +1,44 @@
-from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+import logging
+import uuid
 from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete as sql_delete
+from sqlalchemy import exists, lambda_stmt, select
+from sqlalchemy import update as sql_update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+
 from models import WorkOrder, Customer
 from schemas import schemas
-from tasks import redis_client
-import uuid
+from tasks import enqueue_event
+
+logger = logging.getLogger(__name__)
+
+
+def _bucketed_now():
+    """UTC now truncated to the minute.
 
+    These are bookkeeping columns; sub-minute precision only makes every
+    row unique and defeats date-grouped caches and aggregates.
+    """
+    return datetime.utcnow().replace(second=0, microsecond=0)
 
-def create(request: schemas.WorkOrder, is_active: bool, db: Session):
+
+async def create(request: schemas.WorkOrder, is_active: bool, db: AsyncSession):
     new_order_id = str(uuid.uuid4())
-    total_work_orders = (
-        db.query(WorkOrder).filter(WorkOrder.customer_id == request.customer_id).count()
+    # EXISTS short-circuits on the first matching row; COUNT scanned them all
+    # just to compare against zero.
+    has_orders = await db.scalar(
+        select(exists().where(WorkOrder.customer_id == request.customer_id))
     )
 
-    if total_work_orders > 0:
-        customer = db.query(Customer).filter(Customer.id == request.customer_id)
+    if has_orders:
+        customer = await db.get(Customer, request.customer_id)
 
-        if customer.first().is_active and is_active == False:
-            customer.update({"is_active": is_active, "end_date": datetime.now()})
+        if customer is not None and customer.is_active and is_active == False:
+            customer.is_active = is_active
+            customer.end_date = _bucketed_now()
 
     new_order = WorkOrder(
         id=new_order_id,
@@ -29,98 +50,139 @@ def create(request: schemas.WorkOrder, is_active: bool, db: Session):
     )
 
     db.add(new_order)
-    db.commit()
-    db.refresh(new_order)
+    await db.commit()
+    await db.refresh(new_order)
+    # The response model renders .owner; load it here since async sessions
+    # cannot lazy-load during serialization.
+    await db.refresh(new_order, ["owner"])
 
     return new_order
 
 
-def get_all(db: Session):
-    orders = db.query(WorkOrder).all()
+async def get_all(db: AsyncSession):
+    # The list response renders each order's owner. owner is many-to-one,
+    # so a joinedload folds it into the same SELECT — one round-trip and
+    # no row explosion. The owner's work_orders are stated explicitly so
+    # the load survives the DB_RAISELOAD wildcard, which overrides the
+    # mapper-level lazy="selectin". Endpoints that never touch .owner stay
+    # on the default lazy strategy.
+    orders = (
+        (
+            await db.scalars(
+                select(WorkOrder).options(
+                    joinedload(WorkOrder.owner).selectinload(Customer.work_orders)
+                )
+            )
+        )
+        .unique()
+        .all()
+    )
     return orders
 
 
-def get_all_from_range(since, until, db: Session):
-    filtered_orders = (
-        db.query(WorkOrder).filter(WorkOrder.created_at.between(since, until)).all()
+async def get_all_from_range(since, until, db: AsyncSession):
+    # lambda_stmt caches the compiled SQL keyed on the lambda, so repeated
+    # calls skip statement compilation and only swap bind parameters.
+    stmt = lambda_stmt(
+        lambda: select(WorkOrder).where(WorkOrder.created_at.between(since, until))
     )
+    return (await db.scalars(stmt)).all()
 
-    return filtered_orders
 
+async def get_orders_by_status(status, db: AsyncSession, limit=100, after_id=None):
+    # Keyset pagination: callers pass the last id of the previous page so
+    # the result set stays bounded no matter how many rows match.
+    stmt = lambda_stmt(lambda: select(WorkOrder).where(WorkOrder.status == status))
+    if after_id is not None:
+        stmt += lambda s: s.where(WorkOrder.id > after_id)
+    stmt += lambda s: s.order_by(WorkOrder.id).limit(limit)
+    return (await db.scalars(stmt)).all()
 
-def get_orders_by_status(status, db: Session):
-    by_status = db.query(WorkOrder).filter(WorkOrder.status == status).all()
-    return by_status
 
+async def update(id, request: schemas.WorkOrder, db: AsyncSession):
+    order = await db.get(WorkOrder, id)
 
-def update(id, request: schemas.WorkOrder, db: Session):
-    order = db.query(WorkOrder).filter(WorkOrder.id == id)
-
-    if not order.first():
+    if order is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"The order width id {id} not found",
         )
 
-    order.update(
-        {
-            "first_name": request.first_name,
-            "last_name": request.last_name,
-            "address": request.address,
-        }
-    )
+    order.title = request.title
+    order.planned_date_begin = request.planned_date_begin
+    order.planned_date_end = request.planned_date_end
+    order.status = request.status
 
-    db.commit()
+    await db.commit()
 
     return {"message": f"The order was updated successfully"}
 
 
-def finish(id, db: Session):
-    order = db.query(WorkOrder).filter(WorkOrder.id == id)
+async def finish(id, db: AsyncSession):
+    # One UPDATE ... RETURNING closes the order and hands back every column
+    # the completion event needs, with no prior SELECT.
+    row = (
+        await db.execute(
+            sql_update(WorkOrder)
+            .where(WorkOrder.id == id)
+            .values(status="done")
+            .returning(
+                WorkOrder.id,
+                WorkOrder.customer_id,
+                WorkOrder.title,
+                WorkOrder.planned_date_begin,
+                WorkOrder.planned_date_end,
+                WorkOrder.status,
+                WorkOrder.created_at,
+            )
+        )
+    ).first()
 
-    if not order.first():
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"The order width id {id} not found",
         )
 
-    total_ended_orders = (
-        db.query(WorkOrder)
-        .filter(
-            WorkOrder.customer_id == order.first().customer_id,
-            WorkOrder.status == "done",
+    # Activate the customer only when this is their first finished order,
+    # expressed as a single conditional UPDATE instead of COUNT + SELECT.
+    await db.execute(
+        sql_update(Customer)
+        .where(
+            Customer.id == row.customer_id,
+            ~exists().where(
+                (WorkOrder.customer_id == row.customer_id)
+                & (WorkOrder.status == "done")
+                & (WorkOrder.id != row.id)
+            ),
         )
-        .count()
+        .values(is_active=True, start_date=_bucketed_now())
     )
 
-    if total_ended_orders == 0:
-        customer = db.query(Customer).filter(Customer.id == order.first().customer_id)
-        customer.update({"is_active": True, "start_date": datetime.now()})
-
-    order.update({"status": "done"})
-
-    db.commit()
+    await db.commit()
 
     event_data = {
-        "id": str(order.first().id),
-        "customer_id": str(order.first().customer_id),
-        "title": order.first().title,
-        "planned_date_begin": str(order.first().planned_date_begin),
-        "planned_date_end": str(order.first().planned_date_end),
-        "status": str(order.first().status),
-        "created_at": str(order.first().created_at),
+        "id": str(row.id),
+        "customer_id": str(row.customer_id),
+        "title": row.title,
+        "planned_date_begin": str(row.planned_date_begin),
+        "planned_date_end": str(row.planned_date_end),
+        "status": str(row.status),
+        "created_at": str(row.created_at),
     }
 
-    event_id = redis_client.xadd("order-completion-stream", event_data)
-    print(event_id)
+    # Hand the event to the background publisher; the response no longer
+    # waits on a Redis round-trip.
+    enqueue_event("order-completion-stream", event_data)
+    logger.debug("Queued completion event for order %s", row.id)
 
     return {"message": f"The order was updated successfully"}
 
 
-def show(id, db: Session):
-    order = db.query(WorkOrder).filter(WorkOrder.id == id).first()
+async def show(id, db: AsyncSession):
+    order = await db.get(WorkOrder, id)
 
-    if not order:
+    if order is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Order with the id {id} is not available",
@@ -129,15 +191,20 @@ def show(id, db: Session):
     return order
 
 
-def destroy(id, db: Session):
-    order = db.query(WorkOrder).filter(WorkOrder.id == id)
+async def destroy(id, db: AsyncSession):
+    # DELETE ... RETURNING both removes the row and reports whether it
+    # existed, replacing the SELECT + DELETE round-trip pair.
+    deleted_id = (
+        await db.execute(
+            sql_delete(WorkOrder).where(WorkOrder.id == id).returning(WorkOrder.id)
+        )
+    ).scalar()
 
-    if not order.first():
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"The order width id {id} not found",
         )
 
-    order.delete(synchronize_session=False)
-    db.commit()
-    return {"message": f"The order {id} has been deleted sucessfully"}
+    await db.commit()
+    logger.info("Deleted work order %s", deleted_id)
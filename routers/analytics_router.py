@@ -1,115 +1,154 @@
-from fastapi import APIRouter, Depends, status, Response
-from sqlalchemy.orm import Session
+import asyncio
 import io
+
+from fastapi import APIRouter, Depends, status, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import matplotlib
+
+# Headless raster backend; the default interactive backend keeps global
+# state and leaks figures across requests.
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
-import seaborn as sns
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 import plotly.express as px
-import pandas as pd
 from schemas import schemas
-from database import get_db
+from database import get_db_lazy
 from repositories import analytics_repository
+from tasks.cache import cached_json, cached_png
 
 router = APIRouter(prefix="/v1/analytics", tags=["Analytics"])
 
 
+def _fig_to_png(fig) -> bytes:
+    img = io.BytesIO()
+    fig.savefig(img, format="png")
+    plt.close(fig)
+    return img.getvalue()
+
+
+def _render_average_duration(avg) -> bytes:
+    fig, ax = plt.subplots()
+    ax.bar(["Average"], [avg])
+    ax.set_ylabel("Duration")
+    ax.set_title("Average Duration of Completed Work Orders")
+    return _fig_to_png(fig)
+
+
+def _render_order_frequency(frequencies) -> bytes:
+    customer_ids, order_counts = zip(*frequencies) if frequencies else ((), ())
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.bar([str(customer_id) for customer_id in customer_ids], order_counts)
+    ax.set_xlabel("customer_id")
+    ax.set_ylabel("order_count")
+    return _fig_to_png(fig)
+
+
+def _render_customer_activity(activities) -> bytes:
+    by_year = {}
+    for year, month, total_orders in activities:
+        by_year.setdefault(year, ([], []))
+        by_year[year][0].append(month)
+        by_year[year][1].append(total_orders)
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    for year, (months, totals) in by_year.items():
+        ax.plot(months, totals, label=str(year))
+    ax.set_xlabel("month")
+    ax.set_ylabel("total_orders")
+    if by_year:
+        ax.legend(title="year")
+    return _fig_to_png(fig)
+
+
+def _render_active_customers(count) -> bytes:
+    fig, ax = plt.subplots(figsize=(5, 5))
+    ax.pie([count], labels=["Active Customers"])
+    return _fig_to_png(fig)
+
+
 @router.get("/average-duration")
-def get_average_duration(db: Session = Depends(get_db)):
-    average_duration = analytics_repository.calculate_average_duration(db)
+@cached_json("average_duration")
+async def get_average_duration(db: AsyncSession = Depends(get_db_lazy)):
+    average_duration = await analytics_repository.calculate_average_duration(db)
     return {"average_duration": average_duration}
 
 
 @router.get("/order-frequency")
-def get_order_frequency(db: Session = Depends(get_db)):
-    order_frequencies = analytics_repository.order_frequency_per_customer(db)
-    return [
-        {"customer_id": customer_id, "order_count": order_count}
-        for customer_id, order_count in order_frequencies
-    ]
+@cached_json("order_frequency")
+async def get_order_frequency(db: AsyncSession = Depends(get_db_lazy)):
+    order_frequencies = await analytics_repository.order_frequency_per_customer(db)
+    # orjson serializes the row mappings (UUIDs included) natively;
+    # returning a Response skips the jsonable_encoder pass entirely.
+    return ORJSONResponse([dict(row._mapping) for row in order_frequencies])
 
 
 @router.get("/customer-activity")
-def get_customer_activity_periods(db: Session = Depends(get_db)):
-    customer_activity_periods = analytics_repository.identify_customer_activity_periods(
-        db
+@cached_json("customer_activity")
+async def get_customer_activity_periods(db: AsyncSession = Depends(get_db_lazy)):
+    customer_activity_periods = (
+        await analytics_repository.identify_customer_activity_periods(db)
     )
-    return [
-        {"year": year, "month": month, "total_orders": total_orders}
-        for year, month, total_orders in customer_activity_periods
-    ]
+    return ORJSONResponse([dict(row._mapping) for row in customer_activity_periods])
 
 
 @router.get("/active-customers")
-def get_active_customers(start: str, end: str, db: Session = Depends(get_db)):
+@cached_json("active_customers")
+async def get_active_customers(
+    start: str, end: str, db: AsyncSession = Depends(get_db_lazy)
+):
     start_date = schemas.parse_datetime(start)
     end_date = schemas.parse_datetime(end)
-    active_customer_count = analytics_repository.count_active_customers(
+    active_customer_count = await analytics_repository.count_active_customers(
         db, start_date, end_date
     )
     return {"active_customer_count": active_customer_count}
 
 
 @router.get("/average-duration-img")
-def average_duration(db: Session = Depends(get_db)):
-    avg = analytics_repository.calculate_average_duration(db)
-
-    fig, ax = plt.subplots()
-    ax.bar(["Average"], [avg])
-    ax.set_ylabel("Duration")
-    ax.set_title("Average Duration of Completed Work Orders")
+@cached_png("average_duration")
+async def average_duration(db: AsyncSession = Depends(get_db_lazy)):
+    avg = await analytics_repository.calculate_average_duration(db)
 
-    img = io.BytesIO()
-    plt.savefig(img, format="png")
-    img.seek(0)
-
-    return Response(content=img.getvalue(), media_type="image/png")
+    # matplotlib is CPU-bound; render in a worker thread so chart
+    # generation does not stall the event loop.
+    png = await asyncio.to_thread(_render_average_duration, avg)
+    return Response(content=png, media_type="image/png")
 
 
 # Order frequency
 @router.get("/order-frequency/image")
-def order_frequency_image(db: Session = Depends(get_db)):
-    frequencies = analytics_repository.order_frequency_per_customer(db)
-
-    df = pd.DataFrame(frequencies, columns=["customer_id", "order_count"])
+@cached_png("order_frequency")
+async def order_frequency_image(db: AsyncSession = Depends(get_db_lazy)):
+    frequencies = await analytics_repository.order_frequency_per_customer(db)
 
-    plt.figure(figsize=(10, 6))
-    sns.barplot(x="customer_id", y="order_count", data=df)
-
-    img = io.BytesIO()
-    plt.savefig(img, format="png")
-
-    return Response(img.getvalue(), media_type="image/png")
+    png = await asyncio.to_thread(_render_order_frequency, frequencies)
+    return Response(png, media_type="image/png")
 
 
 # Customer activity
 @router.get("/customer-activity/image")
-def customer_activity_image(db: Session = Depends(get_db)):
-    activities = analytics_repository.identify_customer_activity_periods(db)
-
-    df = pd.DataFrame(activities, columns=["year", "month", "total_orders"])
-
-    plt.figure(figsize=(10, 6))
-    sns.lineplot(data=df, x="month", y="total_orders", hue="year")
+@cached_png("customer_activity")
+async def customer_activity_image(db: AsyncSession = Depends(get_db_lazy)):
+    activities = await analytics_repository.identify_customer_activity_periods(db)
 
-    img = io.BytesIO()
-    plt.savefig(img, format="png")
-
-    return Response(img.getvalue(), media_type="image/png")
+    png = await asyncio.to_thread(_render_customer_activity, activities)
+    return Response(png, media_type="image/png")
 
 
 # Active customers
 @router.get("/active-customers/image")
-def active_customers_image(start: str, end: str, db: Session = Depends(get_db)):
+@cached_png("active_customers")
+async def active_customers_image(
+    start: str, end: str, db: AsyncSession = Depends(get_db_lazy)
+):
     start_date = schemas.parse_datetime(start)
     end_date = schemas.parse_datetime(end)
 
-    count = analytics_repository.count_active_customers(db, start_date, end_date)
-
-    plt.figure(figsize=(5, 5))
-    plt.pie([count], labels=["Active Customers"])
-
-    img = io.BytesIO()
-    plt.savefig(img, format="png")
+    count = await analytics_repository.count_active_customers(db, start_date, end_date)
 
-    return Response(img.getvalue(), media_type="image/png")
+    png = await asyncio.to_thread(_render_active_customers, count)
+    return Response(png, media_type="image/png")
@@ -1,6 +1,7 @@
+import uuid
 from typing import List
 from fastapi import APIRouter, Depends, status, Response, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from database import get_db
@@ -14,32 +15,49 @@ router = APIRouter(prefix="/v1/customers", tags=["Customers"])
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
-def create(request: schemas.Customer, db: Session = Depends(get_db)):
-    return customer_repository.create_customer(request, db)
+async def create(
+    request: schemas.Customer = Depends(schemas.json_body(schemas.Customer)),
+    db: AsyncSession = Depends(get_db),
+):
+    return await customer_repository.create_customer(request, db)
 
 
 @router.put("/{id}", status_code=status.HTTP_202_ACCEPTED)
-def update(id, request: schemas.Customer, db: Session = Depends(get_db)):
-    return customer_repository.update_customer(id, request, db)
+async def update(
+    id: uuid.UUID,
+    request: schemas.Customer = Depends(schemas.json_body(schemas.Customer)),
+    db: AsyncSession = Depends(get_db),
+):
+    return await customer_repository.update_customer(id, request, db)
 
 
-@router.get("/", response_model=List[schemas.ShowCustomerWorkOrderList])
-def get_all(db: Session = Depends(get_db)):
-    return customer_repository.get_all_customer(db)
+@router.get("/")
+async def get_all(db: AsyncSession = Depends(get_db)):
+    customers = await customer_repository.get_all_customer(db)
+    # The module-level adapter serializes the whole list in one rust-side
+    # pass, skipping both validation and the jsonable_encoder walk.
+    return Response(
+        content=schemas.dump_customers(customers), media_type="application/json"
+    )
 
 
 @router.get("/active")
-def get_active(db: Session = Depends(get_db)):
-    return customer_repository.get_active_customer(db)
+async def get_active(db: AsyncSession = Depends(get_db)):
+    return await customer_repository.get_active_customer(db)
 
 
-@router.get(
-    "/{id}", status_code=status.HTTP_200_OK, response_model=schemas.ShowCustomer
-)
-def show(id, db: Session = Depends(get_db)):
-    return customer_repository.get_customer_by_id(id, db)
+@router.get("/{id}", status_code=status.HTTP_200_OK)
+async def show(id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+    customer = await customer_repository.get_customer_by_id(id, db)
+    return Response(
+        content=schemas.construct_show_customer(customer).model_dump_json(),
+        media_type="application/json",
+    )
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_customer(id, db: Session = Depends(get_db)):
-    return customer_repository.delete_customer(id, db)
+async def delete_customer(id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+    await customer_repository.delete_customer(id, db)
+    # 204 mandates an empty body; a bare Response skips the encoder work
+    # a JSON body would pay only to be dropped.
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,65 +1,128 @@
+import uuid
 from typing import List, Optional
 from fastapi import APIRouter, Depends, Query, status, Response, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 from datetime import datetime
 
 
-from database import get_db
-from models import WorkOrder
+from database import get_db, get_db_lazy
+from models import Customer, WorkOrder
 from schemas import schemas
 
 from repositories import work_order_repository
+from tasks.cache import cached_json, invalidate
+
+import orjson
+
+# The malformed-query branch is hit by every bad client probe; serialize
+# its constant body once and reply 400 instead of a 200 with an error.
+_MISSING_FILTERS_BODY = orjson.dumps(
+    {
+        "error": "Por favor, proporcione al menos 'since' y 'until' o 'status' para la consulta."
+    }
+)
 
 
 router = APIRouter(prefix="/v1/work_orders", tags=["Work Orders"])
 from typing import Optional
 
 
+def _work_order_dict(order: WorkOrder) -> dict:
+    return {
+        "id": order.id,
+        "customer_id": order.customer_id,
+        "title": order.title,
+        "planned_date_begin": order.planned_date_begin,
+        "planned_date_end": order.planned_date_end,
+        "status": order.status,
+    }
+
+
+
+
 @router.post(
     "/", status_code=status.HTTP_201_CREATED, response_model=schemas.ShowWorkOrder
 )
-def create(request: schemas.WorkOrder, is_active: bool, db: Session = Depends(get_db)):
-    return work_order_repository.create(request, is_active, db)
+async def create(
+    is_active: bool,
+    request: schemas.WorkOrder = Depends(schemas.json_body(schemas.WorkOrder)),
+    db: AsyncSession = Depends(get_db),
+):
+    order = await work_order_repository.create(request, is_active, db)
+    await invalidate("wo")
+    return order
 
 
 @router.put("/{id}", status_code=status.HTTP_202_ACCEPTED)
-def update(id, request: schemas.WorkOrder, db: Session = Depends(get_db)):
-    return work_order_repository.update(id, request, db)
+async def update(
+    id: uuid.UUID,
+    request: schemas.WorkOrder = Depends(schemas.json_body(schemas.WorkOrder)),
+    db: AsyncSession = Depends(get_db),
+):
+    result = await work_order_repository.update(id, request, db)
+    await invalidate("wo")
+    return result
 
 
 @router.put("/{id}/status/done", status_code=status.HTTP_202_ACCEPTED)
-def finish(id, db: Session = Depends(get_db)):
-    return work_order_repository.finish(id, db)
+async def finish(id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+    result = await work_order_repository.finish(id, db)
+    await invalidate("wo")
+    return result
 
 
-@router.get("/", response_model=List[schemas.ShowWorkOrder])
-def get_all(db: Session = Depends(get_db)):
-    return work_order_repository.get_all(db)
+@router.get("/")
+@cached_json("all", ttl=30, prefix="wo")
+async def get_all(db: AsyncSession = Depends(get_db_lazy)):
+    orders = await work_order_repository.get_all(db)
+    # The module-level adapter serializes the whole list in one rust-side
+    # pass, skipping both validation and the jsonable_encoder walk.
+    return Response(
+        content=schemas.dump_work_orders(orders), media_type="application/json"
+    )
 
 
 @router.get("/status-or-date")
-def get_orders_within_range_or_by_status(
+@cached_json("status_or_date", ttl=10, prefix="wo")
+async def get_orders_within_range_or_by_status(
     since: Optional[datetime] = None,
     until: Optional[datetime] = None,
     status: Optional[str] = None,
-    db: Session = Depends(get_db),
+    limit: int = Query(100, ge=1, le=500),
+    after_id: Optional[uuid.UUID] = None,
+    db: AsyncSession = Depends(get_db_lazy),
 ):
     if since and until:
-        return work_order_repository.get_all_from_range(since, until, db)
+        orders = await work_order_repository.get_all_from_range(since, until, db)
+        return [_work_order_dict(order) for order in orders]
 
     if status:
-        return work_order_repository.get_orders_by_status(status, db)
+        orders = await work_order_repository.get_orders_by_status(
+            status, db, limit=limit, after_id=after_id
+        )
+        return [_work_order_dict(order) for order in orders]
 
-    return {
-        "error": "Por favor, proporcione al menos 'since' y 'until' o 'status' para la consulta."
-    }
+    # The status query param shadows the fastapi.status module here.
+    return Response(
+        content=_MISSING_FILTERS_BODY, media_type="application/json", status_code=400
+    )
 
 
-@router.get(
-    "/{id}", status_code=status.HTTP_200_OK, response_model=schemas.ShowWorkOrder
-)
-def show(id, response: Response, db: Session = Depends(get_db)):
-    order = db.query(WorkOrder).filter(WorkOrder.id == id).first()
+@router.get("/{id}", status_code=status.HTTP_200_OK)
+@cached_json("show", ttl=15, prefix="wo")
+async def show(
+    id: uuid.UUID, response: Response, db: AsyncSession = Depends(get_db_lazy)
+):
+    # Session.get() consults the identity map before emitting the
+    # primary-key SELECT. The response renders .owner and its work_orders;
+    # eager-load both since async sessions cannot lazy-load during
+    # serialization and the DB_RAISELOAD wildcard overrides lazy="selectin".
+    order = await db.get(
+        WorkOrder,
+        id,
+        options=[joinedload(WorkOrder.owner).selectinload(Customer.work_orders)],
+    )
 
     if not order:
         response.status_code = status.HTTP_404_NOT_FOUND
@@ -68,19 +131,16 @@ def show(id, response: Response, db: Session = Depends(get_db)):
             detail=f"Order with the id {id} is not available",
         )
 
-    return order
+    return Response(
+        content=schemas.construct_show_work_order(order).model_dump_json(),
+        media_type="application/json",
+    )
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
-def destroy(id, db: Session = Depends(get_db)):
-    order = db.query(WorkOrder).filter(WorkOrder.id == id)
-
-    if not order.first():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"The order width id {id} not found",
-        )
-
-    order.delete(synchronize_session=False)
-    db.commit()
-    return {"message": f"The order {id} has been deleted sucessfully"}
+async def destroy(id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+    await work_order_repository.destroy(id, db)
+    await invalidate("wo")
+    # 204 mandates an empty body; a bare Response skips the encoder work
+    # a JSON body would pay only to be dropped.
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1 +1,9 @@
-from .redis import redis_client
+from .events import enqueue_event, start_publisher, stop_publisher
+from .redis import (
+    get_redis,
+    redis_async_client,
+    redis_client,
+    safe_redis_xadd,
+    safe_redis_xadd_many,
+    xadd_many,
+)
@@ -0,0 +1,133 @@
+import asyncio
+import time
+from functools import wraps
+
+import orjson
+from fastapi import Response
+from sqlalchemy.exc import SQLAlchemyError
+
+from .redis import redis_binary_client
+
+DEFAULT_TTL = 300
+
+# Request-plumbing kwargs that must not participate in cache keys.
+_EXCLUDED_PARAMS = frozenset({"db", "response"})
+
+
+def _bucket(ttl, offset=0):
+    """Start of the current fixed interval (or an earlier one when offset
+    is set), so identical requests within a bucket share one cache entry."""
+    return int(time.time() // ttl * ttl) - offset * ttl
+
+
+def _key(prefix, name, ttl, kwargs, offset=0):
+    params = ":".join(
+        f"{key}={value}"
+        for key, value in sorted(kwargs.items())
+        if key not in _EXCLUDED_PARAMS
+    )
+    key = f"{prefix}:{name}:{_bucket(ttl, offset)}"
+    return f"{key}:{params}" if params else key
+
+
+def cached_json(name, ttl=DEFAULT_TTL, prefix="analytics"):
+    """Cache a JSON-serializable endpoint result in Redis for ``ttl`` seconds.
+
+    Cache failures fall through to the wrapped handler, so a Redis outage
+    degrades to uncached responses rather than errors.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = _key(prefix, name, ttl, kwargs)
+            try:
+                # Sync client in a worker thread; the loop stays free either way.
+                cached = await asyncio.to_thread(redis_binary_client.get, key)
+            except Exception:
+                cached = None
+            if cached is not None:
+                return Response(content=cached, media_type="application/json")
+            try:
+                result = await func(*args, **kwargs)
+            except (SQLAlchemyError, OSError):
+                # Serve the previous bucket's entry, if any, rather than
+                # failing the read while the database is unhealthy.
+                try:
+                    stale = await asyncio.to_thread(
+                        redis_binary_client.get, _key(prefix, name, ttl, kwargs, 1)
+                    )
+                except Exception:
+                    stale = None
+                if stale is not None:
+                    return Response(content=stale, media_type="application/json")
+                raise
+            # Only successful responses are cacheable; replaying an error
+            # body from a hit would also lose its status code.
+            if isinstance(result, Response) and result.status_code != 200:
+                return result
+            try:
+                body = (
+                    result.body
+                    if isinstance(result, Response)
+                    else orjson.dumps(result)
+                )
+                await asyncio.to_thread(redis_binary_client.setex, key, ttl, body)
+            except Exception:
+                pass
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _delete_prefix(prefix):
+    cursor = 0
+    while True:
+        cursor, keys = redis_binary_client.scan(
+            cursor, match=f"{prefix}:*", count=500
+        )
+        if keys:
+            redis_binary_client.delete(*keys)
+        if cursor == 0:
+            break
+
+
+async def invalidate(prefix):
+    """Drop every cache entry under ``prefix`` after a write.
+
+    Best-effort like the rest of the cache: a Redis failure here only
+    means stale reads until the TTL expires.
+    """
+    try:
+        await asyncio.to_thread(_delete_prefix, prefix)
+    except Exception:
+        pass
+
+
+def cached_png(name, ttl=DEFAULT_TTL, prefix="chart"):
+    """Cache the PNG body of a chart endpoint in Redis for ``ttl`` seconds."""
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = _key(prefix, name, ttl, kwargs)
+            try:
+                cached = await asyncio.to_thread(redis_binary_client.get, key)
+            except Exception:
+                cached = None
+            if cached is not None:
+                return Response(content=cached, media_type="image/png")
+            response = await func(*args, **kwargs)
+            try:
+                await asyncio.to_thread(
+                    redis_binary_client.setex, key, ttl, response.body
+                )
+            except Exception:
+                pass
+            return response
+
+        return wrapper
+
+    return decorator
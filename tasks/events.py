@@ -0,0 +1,77 @@
+import asyncio
+import logging
+
+from config import CONFIG
+
+from .redis import safe_redis_xadd, safe_redis_xadd_many
+
+logger = logging.getLogger(__name__)
+
+# Trim kept approximate so Redis drops whole macro-nodes, same cap the
+# inline publish path used.
+_STREAM_MAXLEN = 100000
+_BATCH_MAX = 100
+
+_queue: asyncio.Queue | None = None
+_consumer_task = None
+
+
+def enqueue_event(stream, data):
+    """Hand an event to the background publisher without blocking.
+
+    Write endpoints call this instead of paying a Redis round-trip before
+    their response; durability degrades to the queue plus the breaker's
+    shedding, which these best-effort events already accepted.
+    """
+    if _queue is None:
+        # Consumer not running (scripts, tests): publish inline.
+        return safe_redis_xadd(
+            stream, data, maxlen=_STREAM_MAXLEN, approximate=True
+        )
+    try:
+        _queue.put_nowait((stream, data))
+    except asyncio.QueueFull:
+        logger.warning("Event queue full; dropped event for stream %s", stream)
+
+
+async def _consume():
+    while True:
+        batch = [await _queue.get()]
+        # Coalesce whatever is already waiting so a burst of N events
+        # costs one pipelined round-trip instead of N.
+        while len(batch) < _BATCH_MAX:
+            try:
+                batch.append(_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        await asyncio.to_thread(
+            safe_redis_xadd_many, batch, maxlen=_STREAM_MAXLEN, approximate=True
+        )
+        for _ in batch:
+            _queue.task_done()
+
+
+async def start_publisher():
+    global _queue, _consumer_task
+    _queue = asyncio.Queue(maxsize=CONFIG.EVENT_QUEUE_MAX)
+    _consumer_task = asyncio.create_task(_consume())
+
+
+async def stop_publisher(timeout=5.0):
+    """Drain pending events, then cancel the consumer."""
+    global _queue, _consumer_task
+    if _consumer_task is None:
+        return
+    try:
+        await asyncio.wait_for(_queue.join(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Shutdown with %d events still queued", _queue.qsize()
+        )
+    _consumer_task.cancel()
+    try:
+        await _consumer_task
+    except asyncio.CancelledError:
+        pass
+    _queue = None
+    _consumer_task = None
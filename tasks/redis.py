@@ -1,6 +1,114 @@
+import logging
+
 import redis
-from config import Config
+import redis.asyncio
+
+from config import CONFIG
+from error_handlers import CircuitBreakerOpenError, event_queue, redis_circuit_breaker
+
+logger = logging.getLogger(__name__)
+
+# Explicit pools shared by every client below. Connections are opened
+# lazily on first command, so importing this module never blocks on a
+# Redis round-trip; the startup event owns the smoke-test ping.
+_MAX_CONNECTIONS = CONFIG.DB_POOL_SIZE * 4
+
+# Keepalive stops idle pooled connections from being silently dropped by
+# intermediaries, the periodic health check replaces dead sockets before
+# a command pays for the discovery, and timeouts get one retry.
+_SOCKET_OPTIONS = dict(
+    socket_keepalive=True,
+    health_check_interval=30,
+    retry_on_timeout=True,
+)
+
+_pool = redis.ConnectionPool(
+    host=CONFIG.REDIS_HOST,
+    port=CONFIG.REDIS_PORT,
+    max_connections=_MAX_CONNECTIONS,
+    decode_responses=True,
+    **_SOCKET_OPTIONS,
+)
+
+# Binary payloads (cached PNGs, serialized JSON) must bypass utf-8 decoding.
+_binary_pool = redis.ConnectionPool(
+    host=CONFIG.REDIS_HOST,
+    port=CONFIG.REDIS_PORT,
+    max_connections=_MAX_CONNECTIONS,
+    decode_responses=False,
+    **_SOCKET_OPTIONS,
+)
+
+redis_client = redis.Redis(connection_pool=_pool)
+redis_binary_client = redis.Redis(connection_pool=_binary_pool)
+
+
+def get_redis() -> redis.Redis:
+    """A client backed by the shared pool; cheap to create per call site."""
+    return redis.Redis(connection_pool=_pool)
+
+
+def safe_redis_xadd(stream, data, **kwargs):
+    """XADD through the circuit breaker.
+
+    When Redis is unhealthy the breaker sheds the call instead of letting
+    it fail (or hang) the request that produced the event; the event
+    lands on the bounded fallback queue for the flusher thread to replay.
+    """
+    try:
+        return redis_circuit_breaker.call(get_redis().xadd, stream, data, **kwargs)
+    except CircuitBreakerOpenError:
+        logger.warning("Redis circuit open; queued event for stream %s", stream)
+    except Exception:
+        logger.warning(
+            "Failed to publish event to stream %s; queued for replay",
+            stream,
+            exc_info=True,
+        )
+    event_queue.add_event((stream, data))
+    return None
+
+
+def xadd_many(events, **kwargs):
+    """Pipeline a batch of (stream, data) pairs into one round-trip.
+
+    Raises on failure so callers that own retry/requeue logic (the event
+    queue flusher) can react; request-path callers should use
+    safe_redis_xadd_many instead.
+    """
+    pipeline = redis_client.pipeline(transaction=False)
+    for stream, data in events:
+        pipeline.xadd(stream, data, **kwargs)
+    return pipeline.execute()
+
+
+def safe_redis_xadd_many(events, **kwargs):
+    """Batch XADD through the circuit breaker; like safe_redis_xadd but N
+    events cost one network round-trip, and a failed batch is queued for
+    the flusher to replay."""
+    try:
+        return redis_circuit_breaker.call(xadd_many, events, **kwargs)
+    except CircuitBreakerOpenError:
+        logger.warning("Redis circuit open; queued batch of %d events", len(events))
+    except Exception:
+        logger.warning(
+            "Failed to publish batch of %d events; queued for replay",
+            len(events),
+            exc_info=True,
+        )
+    for event in events:
+        event_queue.add_event(event)
+    return None
+
 
-redis_host = Config.REDIS_HOST
-redis_port = Config.REDIS_PORT
-redis_client = redis.Redis(host=redis_host, port=redis_port, decode_responses=True)
+# Async client for probes and other event-loop callers; tight socket
+# timeouts keep a hung Redis from wedging the caller's time budget.
+redis_async_client = redis.asyncio.Redis(
+    host=CONFIG.REDIS_HOST,
+    port=CONFIG.REDIS_PORT,
+    decode_responses=True,
+    max_connections=20,
+    socket_timeout=1.0,
+    socket_connect_timeout=1.0,
+    health_check_interval=30,
+)
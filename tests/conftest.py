@@ -0,0 +1,113 @@
+import contextlib
+import os
+import uuid
+from datetime import datetime
+
+# config/database resolve their connection targets at import time; give
+# them harmless defaults so the app imports in CI without a full .env.
+# INIT_DB defaults on outside production, and importing main would run
+# create_all against the placeholder URL before any test sees a fixture.
+os.environ.setdefault("INIT_DB", "0")
+os.environ.setdefault("DATABASE_URL", "postgresql://postgres@localhost:5432/test")
+os.environ.setdefault("REDIS_HOST", "localhost")
+os.environ.setdefault("REDIS_PORT", "6379")
+# Fail the run on any unplanned lazy load instead of silently issuing it.
+os.environ.setdefault("DB_RAISELOAD", "1")
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from database import Base
+from models import Customer, WorkOrder
+
+# The models use PostgreSQL-specific column types, so the harness needs a
+# real database. Point TEST_DATABASE_URL at a throwaway one; tests skip
+# when it is not set.
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest_asyncio.fixture
+async def engine():
+    if TEST_DATABASE_URL is None:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    engine = create_async_engine(
+        TEST_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db(engine):
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with maker() as session:
+        yield session
+
+
+@pytest.fixture
+def seed_customer():
+    """Factory seeding one customer with ``orders`` work orders.
+
+    Shared as a fixture rather than a cross-module import; the tests
+    directory has no package __init__, so test modules cannot import
+    each other.
+    """
+
+    async def seed(db, orders=0, status="new"):
+        customer = Customer(
+            id=uuid.uuid4(),
+            first_name="Ada",
+            last_name="Lovelace",
+            address="12 St James's Square",
+        )
+        db.add(customer)
+        order_ids = []
+        for n in range(orders):
+            order_id = uuid.uuid4()
+            db.add(
+                WorkOrder(
+                    id=order_id,
+                    customer_id=customer.id,
+                    title=f"order {n}",
+                    planned_date_begin=datetime(2023, 1, 1),
+                    planned_date_end=datetime(2023, 1, 2),
+                    status=status,
+                )
+            )
+            order_ids.append(order_id)
+        await db.commit()
+        return customer, order_ids
+
+    return seed
+
+
+@pytest.fixture
+def query_counter(engine):
+    """Context manager collecting every statement the engine executes.
+
+    Used to assert query budgets per repository call, so N+1 regressions
+    fail CI instead of surfacing as latency in production.
+    """
+
+    @contextlib.contextmanager
+    def counter():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    return counter
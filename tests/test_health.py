@@ -0,0 +1,34 @@
+import asyncio
+
+import httpx
+import pytest_asyncio
+from httpx import ASGITransport
+
+from main import app
+
+
+@pytest_asyncio.fixture
+async def client():
+    # One AsyncClient over ASGI transport for the whole test: requests hit
+    # the real async app in-process, with no socket or thread hop per call.
+    async with httpx.AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        yield client
+
+
+async def test_probes_respond_concurrently(client):
+    health, ready = await asyncio.gather(client.get("/health"), client.get("/ready"))
+
+    assert health.status_code == 200
+    assert health.json() == {"status": "alive"}
+    # Readiness reflects real dependency state; both verdicts are valid,
+    # it just has to answer.
+    assert ready.status_code in (200, 503)
+
+
+async def test_health_reports_alive_without_dependencies(client):
+    response = await client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "alive"}
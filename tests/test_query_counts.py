@@ -0,0 +1,53 @@
+from sqlalchemy import text
+
+from repositories import (
+    analytics_repository,
+    customer_repository,
+    work_order_repository,
+)
+
+
+async def test_finish_issues_at_most_2_queries(
+    db, seed_customer, query_counter, monkeypatch
+):
+    _, (order_id,) = await seed_customer(db, orders=1)
+    # The completion event now goes through the background publisher; stub
+    # it out so the budget below counts only database statements.
+    monkeypatch.setattr(
+        work_order_repository, "enqueue_event", lambda *args, **kwargs: None
+    )
+
+    with query_counter() as statements:
+        await work_order_repository.finish(order_id, db)
+
+    # One UPDATE ... RETURNING plus one conditional customer activation.
+    assert len(statements) <= 2, statements
+
+
+async def test_get_all_customers_issues_2_queries(db, seed_customer, query_counter):
+    for _ in range(3):
+        await seed_customer(db, orders=2)
+
+    with query_counter() as statements:
+        await customer_repository.get_all_customer(db)
+
+    # The customer SELECT plus one selectin IN-query for all work orders,
+    # independent of how many customers match.
+    assert len(statements) == 2, statements
+
+
+async def test_analytics_order_frequency_single_query(db, query_counter):
+    # The aggregate table normally comes from the Alembic migration; the
+    # harness only needs its shape.
+    await db.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS agg_customer_orders "
+            "(customer_id uuid PRIMARY KEY, cnt bigint NOT NULL)"
+        )
+    )
+    await db.commit()
+
+    with query_counter() as statements:
+        await analytics_repository.order_frequency_per_customer(db)
+
+    assert len(statements) == 1, statements
@@ -0,0 +1,47 @@
+from sqlalchemy.orm import joinedload, selectinload
+
+from config import CONFIG
+from models import Customer, WorkOrder
+from repositories import customer_repository, work_order_repository
+from schemas import schemas
+
+
+def test_raiseload_guard_is_armed():
+    # conftest turns the guard on before database is imported; if this
+    # fails the rest of this module proves nothing.
+    assert CONFIG.DB_RAISELOAD
+
+
+async def test_get_all_serializes_under_raiseload(db, seed_customer):
+    await seed_customer(db, orders=2)
+
+    orders = await work_order_repository.get_all(db)
+    # Serialization walks order.owner.work_orders; under the raiseload
+    # wildcard any relationship the query did not plan for raises here.
+    body = schemas.dump_work_orders(orders)
+
+    assert body
+
+
+async def test_show_serializes_under_raiseload(db, seed_customer):
+    _, (order_id,) = await seed_customer(db, orders=1)
+    db.expunge_all()
+
+    order = await db.get(
+        WorkOrder,
+        order_id,
+        options=[joinedload(WorkOrder.owner).selectinload(Customer.work_orders)],
+    )
+
+    assert schemas.construct_show_work_order(order).model_dump_json()
+
+
+async def test_active_customers_serialize_under_raiseload(db, seed_customer):
+    customer, _ = await seed_customer(db, orders=1)
+    customer.is_active = True
+    await db.commit()
+    db.expunge_all()
+
+    customers = await customer_repository.get_active_customer(db)
+
+    assert [schemas.construct_show_customer(c).work_orders for c in customers]